@@ -1,19 +1,32 @@
 import os
+import numpy as np
 import pandas as pd
 import calendar
 from datetime import datetime
+from functools import lru_cache
 from itertools import product
 from typing import Dict, Tuple
 
+WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
 
 def test_env():
     """Check current environment for testing purposes"""
     return os.getenv("ENV") == "TEST"
 
 
+@lru_cache(maxsize=None)
 def list_range(n=0):
-    """Create a list of integers from 1 to n (inclusive)."""
-    return [*range(1, n + 1)]
+    """Create a tuple of integers from 1 to n (inclusive), cached per n."""
+    return tuple(range(1, n + 1))
 
 
 def month(month: int | None = None):
@@ -56,17 +69,18 @@ def list_indices(*dimensions):
         dimensions: Variable-length list of integers representing the range for each dimension.
 
     Returns:
-        List of tuples representing the Cartesian product of indices.
+        Lazy iterable of tuples representing the Cartesian product of indices,
+        wrap it in list() if it has to be traversed more than once.
     """
     if len(dimensions) == 0:
-        return []  # Handle no dimensions gracefully
+        return iter(())  # Handle no dimensions gracefully
     if len(dimensions) == 1:
-        # Return a flat list for a single dimension
-        return [i for i in range(1, dimensions[0] + 1)]
+        # Return a flat range for a single dimension
+        return range(1, dimensions[0] + 1)
 
-    # Generate ranges and compute the Cartesian product
+    # Generate ranges and lazily compute the Cartesian product
     ranges = [range(1, dim + 1) for dim in dimensions]
-    return list(product(*ranges))
+    return product(*ranges)
 
 
 def competency_dict(data_frame: pd.DataFrame):
@@ -80,16 +94,26 @@ def competency_dict(data_frame: pd.DataFrame):
     """
     first_column = data_frame.columns[0]
     re_indexed_data_frame = data_frame.set_index(first_column)
-    re_indexed_dict = re_indexed_data_frame.to_dict(orient="index")
+    if not re_indexed_data_frame.index.is_unique:
+        duplicates = re_indexed_data_frame.index[
+            re_indexed_data_frame.index.duplicated()
+        ].unique()
+        raise ValueError(
+            f"Invalid {first_column}: {list(duplicates)}. Ids must be unique."
+        )
+
+    # Section ids come from the headers, e.g. "Cutting(1)", parse them once
+    section_ids = [
+        int(key[key.index("(") + 1 : key.index(")")])
+        for key in re_indexed_data_frame.columns
+    ]
 
     _dict = {}
-    for outer_key, inner_dict in re_indexed_dict.items():
-        # Transform inner dictionary keys
-        new_inner_dict = {
-            int(key[key.index("(") + 1 : key.index(")")]): value
-            for key, value in inner_dict.items()
-        }
-        _dict[outer_key] = new_inner_dict
+    for outer_key, row_values in zip(
+        re_indexed_data_frame.index,
+        re_indexed_data_frame.itertuples(index=False, name=None),
+    ):
+        _dict[outer_key] = dict(zip(section_ids, row_values))
     return _dict
 
 
@@ -98,15 +122,81 @@ def save_solution_dict(solution: dict):
         file.write(f"solution_dict = {solution}")
 
 
-def group_solutions(solution_dict: dict) -> Tuple[dict, dict, dict]:
-    grouped_data = {"X": {}, "h": {}, "d": {}}
+def group_solutions(
+    solution_dict: dict,
+    num_personnel: int,
+    num_days: int,
+    num_sections: int,
+    num_shifts: int,
+) -> Tuple[np.ndarray, np.ndarray, dict]:
+    """Group solver variables into dense arrays
+
+    Args:
+        solution_dict (dict): solution values keyed by docplex variable name
+        num_personnel (int): number of personnel
+        num_days (int): number of days in the month
+        num_sections (int): number of sections
+        num_shifts (int): number of shifts
+
+    Returns:
+        tuple: X array indexed by [i-1, j-1, k, l], h array indexed by
+            [i-1, j-1] and dictionary of the deviation variables
+    """
+    X = np.zeros(
+        (num_personnel, num_days, num_sections + 1, num_shifts + 1), dtype=np.int8
+    )
+    h = np.zeros((num_personnel, num_days), dtype=np.int8)
+
+    names = np.array(list(solution_dict), dtype=object)
+    values = np.fromiter(solution_dict.values(), dtype=np.float64, count=len(names))
+    prefixes = np.array([name[:2] for name in names])
+
+    for array, prefix, limits in (
+        (X, "X_", (num_personnel, num_days, num_sections, num_shifts)),
+        (h, "h_", (num_personnel, num_days)),
+    ):
+        mask = prefixes == prefix
+        indices = solution_indices(names[mask], prefix, array.ndim)
+        # The model may cover more personnel, days, sections or shifts than are
+        # being scheduled, variables outside the scheduled range are skipped
+        in_range = np.all((indices >= 1) & (indices <= limits), axis=1)
+        found, expected = int(in_range.sum()), int(np.prod(limits))
+        if found < expected:
+            raise ValueError(
+                f"Invalid solution: {found} of {expected} {prefix} variables. "
+                "Solution must cover the whole scheduled range."
+            )
+        indices = indices[in_range]
+        indices[:, :2] -= 1
+        # Binary variables come back as floats close to 0 or 1
+        array[tuple(indices.T)] = values[mask][in_range] >= 0.5
 
-    for key, value in solution_dict.items():
-        if key.startswith("X"):
-            grouped_data["X"][key] = value
-        elif key.startswith("h"):
-            grouped_data["h"][key] = value
-        elif key.startswith("d"):
-            grouped_data["d"][key] = value
+    d = {key: value for key, value in solution_dict.items() if key.startswith("d")}
 
-    return (grouped_data["X"], grouped_data["h"], grouped_data["d"])
+    return (X, h, d)
+
+
+def solution_indices(names, prefix: str, size: int) -> np.ndarray:
+    """Parse indices of variable names such as X_1_2_3_4 in a single pass
+
+    Args:
+        names: variable names sharing the same prefix
+        prefix (str): variable prefix, e.g. "X_"
+        size (int): number of indices in each name
+
+    Returns:
+        np.ndarray: integer matrix of shape (len(names), size)
+    """
+    # A name with a wrong number of indices would shift every row after it
+    if any(name.count("_") != size for name in names):
+        raise ValueError(
+            f"Invalid {prefix} variable names. Each name must have {size} indices."
+        )
+    text = " ".join(names).replace(prefix, "").replace("_", " ")
+    try:
+        indices = np.fromstring(text, dtype=np.int64, sep=" ")
+    except ValueError:
+        indices = None
+    if indices is None or len(indices) != len(names) * size:
+        raise ValueError(f"Invalid {prefix} variable names. Indices must be integers.")
+    return indices.reshape(-1, size)
@@ -1,43 +1,74 @@
-import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment
-import calendar
-from typing import Dict
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+from typing import List
+from src.utils import WEEKDAYS
+
+CENTER = Alignment(horizontal="center", vertical="center")
+HEADER_FONT = Font(bold=True)
+THIN = Side(style="thin")
+HEADER_BORDER = Border(left=THIN, right=THIN, top=THIN, bottom=THIN)
 
 
 class Writer:
     def __init__(self, file_name: str, num_personnel: int, rows_per_person: int):
-        self.schedule: Dict[str, list] | None = None
-        self.weekdays = list(calendar.day_name)
+        self.schedule: List[List[str]] | None = None
         self.file_name: str = file_name
         self.num_personnel: int = num_personnel
         self.rows_per_person: int = rows_per_person
 
-    def write(self, schedule: Dict[str, list], night_shifts: dict, day_shifts: dict):
-        self.data_frame = pd.DataFrame(schedule)
+    def write(
+        self,
+        schedule: List[List[str]],
+        night_shifts: np.ndarray,
+        day_shifts: np.ndarray,
+    ):
+        self.schedule = schedule
         self.day_shifts = day_shifts
         self.night_shifts = night_shifts
         self._create_table()
         self._merge_person_and_shifts_cells()
-        self._center_day_cells()
+        self._write_rows()
         self.workbook.save(self.file_name)
 
     def _create_table(self) -> None:
-        self.data_frame.insert(0, "Personnel", "")
-        self.data_frame.columns = ["Personnel"] + self.weekdays
-        self.data_frame["Day"] = ""
-        self.data_frame["Night"] = ""
-        self.data_frame.to_excel(self.file_name, index=False)
-        self.workbook = load_workbook(self.file_name)
-        self.worksheet = self.workbook.active
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet(title="Sheet1")
+        header = ["Personnel", *WEEKDAYS, "Day", "Night"]
+        self.worksheet.append([self._header_cell(value) for value in header])
+
+    def _header_cell(self, value: str) -> WriteOnlyCell:
+        cell = self._center_cell(value)
+        cell.font = HEADER_FONT
+        cell.border = HEADER_BORDER
+        return cell
+
+    def _center_cell(self, value) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self.worksheet, value=value)
+        cell.alignment = CENTER
+        return cell
 
-    def _center_day_cells(self):
+    def _write_rows(self) -> None:
         for n in range(self.num_personnel):
             start_row, end_row = self._start_end_rows(n)
-            for row in range(start_row, end_row + 1):  # Rows 1 to 3
-                for col in range(2, 9):  # Columns A to C
-                    cell = self.worksheet.cell(row=row, column=col)
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
+            for row in range(start_row, end_row + 1):
+                if row == start_row:
+                    personnel = f"P{n+1}"
+                    # Zero totals stay blank, as they did in the original sheet
+                    day_shift = int(self.day_shifts[n]) or None
+                    night_shift = int(self.night_shifts[n]) or None
+                else:
+                    personnel = day_shift = night_shift = None
+                self.worksheet.append(
+                    [self._center_cell(personnel)]
+                    + self._day_cells(self.schedule[row - 2])
+                    + [self._center_cell(day_shift), self._center_cell(night_shift)]
+                )
+
+    def _day_cells(self, values: List[str]) -> list:
+        return [self._center_cell(value) for value in values]
 
     def _start_end_rows(self, n: int) -> tuple[int, int]:
         start_row = n * self.rows_per_person + 2
@@ -45,31 +76,20 @@ class Writer:
         return start_row, end_row
 
     def _merge_person_and_shifts_cells(self) -> None:
+        # Write-only sheets can't merge after the fact, so the personnel, day
+        # and night ranges of every person are registered up front. They
+        # never overlap, so the set is built directly instead of going
+        # through MultiCellRange.add, which rescans all ranges on each call.
+        ranges = []
         for n in range(self.num_personnel):
-            self._merge_personnel_cells(n)
-            self._merge_dayshift_cells(n)
-            self._merge_nightshift_cells(n)
-
-    def _merge_cells(self, start_row: int, end_row: int, column: int) -> None:
-        self.worksheet.merge_cells(
-            start_row=start_row, start_column=column, end_row=end_row, end_column=column
-        )
-        cell = self.worksheet.cell(row=start_row, column=column)
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    def _merge_personnel_cells(self, n: int) -> None:
-        start_row, end_row = self._start_end_rows(n)
-        self._merge_cells(start_row=start_row, end_row=end_row, column=1)
-        self.worksheet.cell(row=start_row, column=1, value=f"P{n+1}")
-
-    def _merge_dayshift_cells(self, n: int) -> None:
-        start_row, end_row = self._start_end_rows(n)
-        self._merge_cells(start_row=start_row, end_row=end_row, column=9)
-        self.worksheet.cell(row=start_row, column=9, value=self.day_shifts.get(n + 1))
-
-    def _merge_nightshift_cells(self, n: int) -> None:
-        start_row, end_row = self._start_end_rows(n)
-        self._merge_cells(start_row=start_row, end_row=end_row, column=10)
-        self.worksheet.cell(
-            row=start_row, column=10, value=self.night_shifts.get(n + 1)
-        )
+            start_row, end_row = self._start_end_rows(n)
+            for column in (1, 9, 10):
+                ranges.append(
+                    CellRange(
+                        min_col=column,
+                        min_row=start_row,
+                        max_col=column,
+                        max_row=end_row,
+                    )
+                )
+        self.worksheet.merged_cells = MultiCellRange(ranges)